@@ -1,10 +1,6 @@
 import os
 import pygame
 
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()
-
 # Project directories - Match exactly how paths were calculated in the original main.py
 # This is critical for asset loading to work consistently
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Gets to project root
@@ -13,10 +9,6 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 MAP_DIR = os.path.join(ASSETS_DIR, "Maps", "level1")
 
-# Print basic path information, same as in original main.py
-print(f"Assets directory: {ASSETS_DIR}")
-print(f"Map directory: {MAP_DIR}")
-
 # Set up the game window
 WIDTH, HEIGHT = 768, 768
 FPS = 60
@@ -36,3 +28,4 @@ YELLOW = (255, 255, 0)
 
 # Game variables
 CUSTOMER_SPAWN_RATE = 5  # seconds
+COLLISION_CELL_SIZE = 64  # pixels per cell when bucketing customers for food hits
@@ -12,17 +12,37 @@ from src.core.constants import *
 from src.sprites.player import Player
 from src.sprites.customer import Customer
 from src.sprites.food import Food
-from src.sprites.particle import Particle
+from src.sprites.particle import ParticlePool
 from src.map.tilemap import TiledMap
 from src.ui.button import Button
-from src.ui.text import draw_text
+from src.ui.text import draw_text, get_font, render_text
 from src.utils.sounds import load_sounds
 from src.debug.debug_tools import toggle_debug_mode
 from src.debug.logger import log, log_error, log_asset_load
 
+# Locations the level map may be found in, most likely first
+# (MAP_DIR is already assets/Maps/level1, so that location isn't listed twice)
+MAP_NAME = "Level_1_Frame_1.tmx"
+MAP_PATHS = (
+    os.path.join(MAP_DIR, MAP_NAME),
+    os.path.join(ASSETS_DIR, "Maps", MAP_NAME)
+)
+
+# Longest the menu screens sleep waiting for input before checking again (milliseconds)
+MENU_WAIT_TIMEOUT_MS = 250
+
 
 class Game:
     def __init__(self):
+        # Initialize Pygame here rather than on import, so modules can be imported
+        # without starting up the display and audio subsystems
+        pygame.init()
+        pygame.mixer.init()
+        
+        # Report where assets are loaded from (once per run, not on every import)
+        log(f"Assets directory: {ASSETS_DIR}")
+        log(f"Map directory: {MAP_DIR}")
+        
         # Set up the game window
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Jammin' Eats")
@@ -33,15 +53,21 @@ class Game:
         self.score = 0
         self.high_score = 0
         self.game_time = 0
-        self.customer_spawn_timer = 0
+        self.next_customer_spawn_time = CUSTOMER_SPAWN_RATE  # game time of the next spawn
         self.debug_mode = False
         
         # Load font
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
+        
+        # Rendered HUD text keyed by slot, re-rendered only when the value changes
+        self._hud_text = {}
         
         # Load sounds
         self.sounds = load_sounds()
         
+        # Preload food sprites so throwing food never touches the disk
+        Food.preload_frames()
+        
         # Create backgrounds
         self.menu_background = self._create_menu_background()
         self.game_over_background = self._create_game_over_background()
@@ -50,7 +76,7 @@ class Game:
         self.all_sprites = pygame.sprite.Group()
         self.customers = pygame.sprite.Group()
         self.foods = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
+        self.particles = ParticlePool()
         
         # Create UI buttons
         self.start_button = Button(WIDTH // 2 - 100, HEIGHT // 2, 200, 50, "Start", GREEN, (100, 255, 100))
@@ -63,15 +89,25 @@ class Game:
         # Initialize player
         self.player = None
     
+    def _create_vertical_gradient(self, row_color):
+        """Create a window-sized vertical gradient from a function of the row index
+        
+        The gradient is built as a one pixel wide column and stretched to the
+        window width with a single scale, instead of drawing one line per row.
+        It is converted to the display format since it is blitted every frame.
+        """
+        column = bytes(channel for y in range(HEIGHT) for channel in row_color(y))
+        strip = pygame.image.frombuffer(column, (1, HEIGHT), 'RGB')
+        return pygame.transform.scale(strip, (WIDTH, HEIGHT)).convert()
+    
     def _create_menu_background(self):
         # Create menu background programmatically
-        background = pygame.Surface((WIDTH, HEIGHT))
+        def row_color(y):
+            color_value = int(255 * (1 - y / HEIGHT))
+            return (0, color_value // 2, color_value)
         
         # Create a gradient background
-        for y in range(HEIGHT):
-            color_value = int(255 * (1 - y / HEIGHT))
-            color = (0, color_value // 2, color_value)
-            pygame.draw.line(background, color, (0, y), (WIDTH, y))
+        background = self._create_vertical_gradient(row_color)
         
         # Add some decorative elements
         for _ in range(50):
@@ -84,13 +120,11 @@ class Game:
     
     def _create_game_over_background(self):
         # Create game over background
-        background = pygame.Surface((WIDTH, HEIGHT))
-        for y in range(HEIGHT):
+        def row_color(y):
             color_value = int(200 * (1 - y / HEIGHT))
-            color = (color_value + 55, 0, 0)
-            pygame.draw.line(background, color, (0, y), (WIDTH, y))
-            
-        return background
+            return (color_value + 55, 0, 0)
+        
+        return self._create_vertical_gradient(row_color)
     
     def reset_game(self):
         """Reset the game to its initial state"""
@@ -100,42 +134,34 @@ class Game:
         self.all_sprites.empty()
         self.customers.empty()
         self.foods.empty()
-        self.particles.empty()
+        self.particles.clear()
         
         # Reset game variables
         self.score = 0
         self.game_time = 0
-        self.customer_spawn_timer = 0
+        self.next_customer_spawn_time = CUSTOMER_SPAWN_RATE  # game time of the next spawn
         
         # Initialize map
         log("Loading game map...")
         try:
-            # Try to load the map from multiple possible locations
-            map_name = "Level_1_Frame_1.tmx"
-            map_paths = [
-                os.path.join(MAP_DIR, map_name),
-                os.path.join(ASSETS_DIR, "Maps", "level1", map_name),
-                os.path.join(ASSETS_DIR, "Maps", map_name)
-            ]
+            log(f"Trying to load map from {len(MAP_PATHS)} locations")
             
-            # Log the map paths we're trying
-            log(f"Trying to load map from {len(map_paths)} locations")
-            for i, path in enumerate(map_paths):
+            # Try each location in order until one loads, only checking the later
+            # locations if the earlier ones are missing or fail to load
+            map_loaded = False
+            for i, path in enumerate(MAP_PATHS):
                 exists = os.path.exists(path)
                 log(f"  {i+1}. {path} (Exists: {exists})")
-            
-            # Try each path until one works
-            map_loaded = False
-            for path in map_paths:
-                if os.path.exists(path):
-                    try:
-                        log(f"Attempting to load map from: {path}")
-                        self.game_map = TiledMap(path)
-                        log("Map loaded successfully")
-                        map_loaded = True
-                        break
-                    except Exception as e:
-                        log_error(f"Error loading map from {path}", e)
+                if not exists:
+                    continue
+                try:
+                    log(f"Attempting to load map from: {path}")
+                    self.game_map = TiledMap(path)
+                    log("Map loaded successfully")
+                    map_loaded = True
+                    break
+                except Exception as e:
+                    log_error(f"Error loading map from {path}", e)
             
             # If no map was loaded, create a fallback
             if not map_loaded:
@@ -146,20 +172,23 @@ class Game:
             log_error("Critical error loading map", e)
             self.game_map = None
         
-        # Create player
-        log("Creating player...")
-        try:
-            self.player = Player(WIDTH // 2, HEIGHT // 2)
-            self.all_sprites.add(self.player)
-            log("Player created successfully")
-        except Exception as e:
-            log_error("Error creating player", e)
-            # Create a simplified player object if regular creation fails
-            # This is a minimal implementation to prevent crashes
-            from src.sprites.player import create_fallback_player
-            self.player = create_fallback_player(WIDTH // 2, HEIGHT // 2)
-            log("Created fallback player")
-            self.all_sprites.add(self.player)
+        # Create player, or reset the existing one so its sprites aren't loaded again
+        if self.player is not None:
+            log("Resetting player...")
+            self.player.reset(WIDTH // 2, HEIGHT // 2)
+        else:
+            log("Creating player...")
+            try:
+                self.player = Player(WIDTH // 2, HEIGHT // 2)
+                log("Player created successfully")
+            except Exception as e:
+                log_error("Error creating player", e)
+                # Create a simplified player object if regular creation fails
+                # This is a minimal implementation to prevent crashes
+                from src.sprites.player import create_fallback_player
+                self.player = create_fallback_player(WIDTH // 2, HEIGHT // 2)
+                log("Created fallback player")
+        self.all_sprites.add(self.player)
         
         # Change game state to playing
         self.game_state = PLAYING
@@ -167,7 +196,8 @@ class Game:
     
     def spawn_customer(self):
         """Spawn a customer at a valid position"""
-        spawn_time = time.time()  # Start timing for performance monitoring
+        # Time the spawn only in debug mode so normal runs skip the clock reads
+        spawn_start = time.perf_counter() if self.debug_mode else None
         
         if self.game_map:
             # Try to get spawn points from the map
@@ -187,8 +217,7 @@ class Game:
                 
                 if self.debug_mode:
                     print(f"Customer spawned at map position: {pos}")
-                    spawn_time_elapsed = time.time() - spawn_time
-                    print(f"Spawn time: {spawn_time_elapsed:.4f} seconds")
+                    print(f"Spawn time: {time.perf_counter() - spawn_start:.4f} seconds")
                 return
         
         # Fallback: Find a random walkable position if map-based spawning failed
@@ -207,9 +236,7 @@ class Game:
                 
                 if self.debug_mode:
                     print(f"Customer spawned at random position: ({x}, {y})")
-                    if 'spawn_time' in locals():
-                        spawn_time_elapsed = time.time() - spawn_time
-                        print(f"Spawn time: {spawn_time_elapsed:.4f} seconds")
+                    print(f"Spawn time: {time.perf_counter() - spawn_start:.4f} seconds")
                 return
         
         if self.debug_mode:
@@ -218,9 +245,7 @@ class Game:
     def _create_spawn_particles(self, x, y):
         """Helper function to create particle effects at spawn point"""
         for _ in range(10):
-            particle = Particle(x, y, (255, 255, 255), size=random.randint(2, 5), speed=1.5, lifetime=0.5)
-            self.particles.add(particle)
-            self.all_sprites.add(particle)
+            self.particles.spawn(x, y, (255, 255, 255), size=random.randint(2, 5), speed=1.5, lifetime=0.5)
     
     def validate_customer_positions(self):
         """Checks all customers to ensure they're in valid positions"""
@@ -250,22 +275,52 @@ class Game:
             self.start_button = Button(WIDTH // 2 - 100, HEIGHT // 2, 200, 50, "Start", GREEN, (100, 255, 100))
             self.exit_button = Button(WIDTH // 2 - 100, HEIGHT // 2 + 70, 200, 50, "Exit", RED, (255, 100, 100))
         
+        # Functions called every frame, looked up once instead of on each iteration
+        tick = self.clock.tick
+        get_mouse_pos = pygame.mouse.get_pos
+        get_events = pygame.event.get
+        wait_event = pygame.event.wait
+        flip = pygame.display.flip
+        update_display = pygame.display.update
+        
+        # State of the last frame drawn, so static screens are only redrawn on input
+        drawn_state = None
+        
+        # Screen areas changed by the last gameplay frame, or None when the next frame
+        # has to be presented in full
+        last_dirty = None
+        
         while running:
+            # The menu and game over screens only change in response to input, so once
+            # drawn, sleep until an event arrives instead of redrawing them every frame
+            waited_events = []
+            if self.game_state != PLAYING and self.game_state == drawn_state:
+                event = wait_event(MENU_WAIT_TIMEOUT_MS)
+                if event.type == pygame.NOEVENT:
+                    continue
+                waited_events.append(event)
+                tick()  # Don't count the time spent waiting as frame time
+            
             # Calculate delta time for frame-rate independent physics
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = tick(FPS) / 1000.0
             
             # Process events
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = get_mouse_pos()
             
-            for event in pygame.event.get():
+            for event in waited_events + get_events():
                 if event.type == pygame.QUIT:
                     running = False
                 
                 elif event.type == pygame.VIDEORESIZE:
                     # Update the screen surface to the new size
                     self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                    last_dirty = None
                     # Optionally, store new width/height if you use them elsewhere:
-                   # WIDTH, HEIGHT = event.size
+                    # WIDTH, HEIGHT = event.size
+                
+                elif event.type == pygame.WINDOWEXPOSED:
+                    # The window contents may have been lost, so present the next frame in full
+                    last_dirty = None
 
 
                 if event.type == pygame.KEYDOWN:
@@ -299,83 +354,20 @@ class Game:
                 self.game_time += dt
                 
                 # Spawn customers at regular intervals
-                self.customer_spawn_timer += dt
-                if self.customer_spawn_timer >= CUSTOMER_SPAWN_RATE:
+                if self.game_time >= self.next_customer_spawn_time:
                     self.spawn_customer()
-                    self.customer_spawn_timer = 0
+                    self.next_customer_spawn_time = self.game_time + CUSTOMER_SPAWN_RATE
                 
                 # Update game elements
                 self.player.update(dt, self.customers, self.foods, self.game_map)
                 self.customers.update(dt)
                 self.foods.update(dt)
                 
-                # Check for food-customer collisions
-                for food in list(self.foods):
-                    for customer in self.customers:
-                        if food.rect.colliderect(customer.rect):
-                            # Check if customer likes this type of food
-                            if customer.food_preference == food.food_type:
-                                # Correct food delivered
-                                self.score += 100
-                                if 'pickup_sound' in self.sounds and self.sounds['pickup_sound']:
-                                    self.sounds['pickup_sound'].play()
-                                
-                                # Customer leaves
-                                customer.feed(food.food_type)
-                                self.player.deliveries += 1
-                                
-                                # Create happy particles
-                                for _ in range(15):
-                                    particle = Particle(
-                                        customer.rect.centerx,
-                                        customer.rect.centery,
-                                        GREEN,
-                                        size=random.randint(3, 6),
-                                        speed=2,
-                                        lifetime=0.8
-                                    )
-                                    self.particles.add(particle)
-                                    self.all_sprites.add(particle)
-                            
-                            # Remove the food
-                            food.kill()
-                
-                # Update particles
-                self.particles.update(dt)
-                
-                # Update high score
-                self.high_score = max(self.high_score, self.score)
-                
-                # Check game over condition (optional)
-                if self.player.missed_deliveries >= 10:
-                    self.game_state = GAME_OVER
-            
-            # Render frame
-            self._render(mouse_pos)
-            
-            # Update the display
-            pygame.display.flip()
-        
-        # Update game state
-        if self.game_state == PLAYING:
-            # Update game time
-            self.game_time += dt
-            
-            # Spawn customers at regular intervals
-            self.customer_spawn_timer += dt
-            if self.customer_spawn_timer >= CUSTOMER_SPAWN_RATE:
-                self.spawn_customer()
-                self.customer_spawn_timer = 0
-            
-            # Update game elements
-            self.player.update(dt, self.customers, self.foods, self.game_map)
-            self.customers.update(dt)
-            self.foods.update(dt)
-            
-            # Check for food-customer collisions
-            for food in list(self.foods):
-                for customer in self.customers:
-                    if food.rect.colliderect(customer.rect):
+                # Check for food-customer collisions (foods that hit anyone are removed)
+                hits = self._find_food_hits() if self.foods and self.customers else {}
+                for food, hit_customers in hits.items():
+                    food.kill()
+                    for customer in hit_customers:
                         # Check if customer likes this type of food
                         if customer.food_preference == food.food_type:
                             # Correct food delivered
@@ -389,7 +381,7 @@ class Game:
                             
                             # Create happy particles
                             for _ in range(15):
-                                particle = Particle(
+                                self.particles.spawn(
                                     customer.rect.centerx,
                                     customer.rect.centery,
                                     GREEN,
@@ -397,37 +389,92 @@ class Game:
                                     speed=2,
                                     lifetime=0.8
                                 )
-                                self.particles.add(particle)
-                                self.all_sprites.add(particle)
-                        
-                        # Remove the food
-                        food.kill()
-            
-            # Update particles
-            self.particles.update(dt)
+                            
+                            # The food is used up once someone eats it
+                            break
+                
+                # Update particles (nothing to do when none are alive)
+                if self.particles:
+                    self.particles.update(dt)
+                
+                # Update high score
+                self.high_score = max(self.high_score, self.score)
+                
+                # Check game over condition (optional)
+                if self.player.missed_deliveries >= 10:
+                    self.game_state = GAME_OVER
             
-            # Update high score
-            self.high_score = max(self.high_score, self.score)
+            # Render frame
+            dirty = self._render(mouse_pos, last_dirty)
             
-            # Check game over condition (optional)
-            if self.player.missed_deliveries >= 10:
-                self.game_state = GAME_OVER
-        
-        # Render frame
-        self._render(mouse_pos)
+            # Update the display. During gameplay the map is static, so only the areas
+            # drawn over this frame or the last one need presenting; anything else
+            # (first frame, menus, debug overlays, resizes) is presented in full
+            if dirty is not None and last_dirty is not None:
+                update_display(last_dirty + dirty)
+            else:
+                flip()
+            last_dirty = dirty
+            drawn_state = self.game_state
         
-        # Update the display
-        pygame.display.flip()
-    
         # Check if we should exit
         if not running:
             # Clean up
             pygame.quit()
             sys.exit()
 
-    def _render(self, mouse_pos):
-        """Render the game frame based on current game state"""
-        self.screen.fill((BLACK))  # Or your preferred fallback color
+    def _find_food_hits(self):
+        """Map each food to the customers it touches, in group order
+        
+        Customers are bucketed into a coarse grid of cells, so each food is only
+        tested against customers sharing one of the cells it covers.
+        """
+        cell = COLLISION_CELL_SIZE
+        
+        # Bucket customers (with their group position) by every cell their rect covers
+        grid = {}
+        for index, customer in enumerate(self.customers):
+            rect = customer.rect
+            for cell_x in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cell_y in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    grid.setdefault((cell_x, cell_y), []).append((index, customer))
+        
+        hits = {}
+        for food in self.foods:
+            rect = food.rect
+            
+            # Gather nearby customers once each, then test them in group order
+            nearby = {}
+            for cell_x in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cell_y in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    nearby.update(grid.get((cell_x, cell_y), ()))
+            
+            hit_customers = [customer for _, customer in sorted(nearby.items())
+                             if rect.colliderect(customer.rect)]
+            if hit_customers:
+                hits[food] = hit_customers
+        return hits
+
+    def _render_hud_text(self, slot, text):
+        """Return the rendered HUD text for a slot, re-rendering only when its text changes"""
+        cached = self._hud_text.get(slot)
+        if cached is None or cached[0] != text:
+            cached = self._hud_text[slot] = (text, self.font.render(text, True, WHITE))
+        return cached[1]
+
+    def _render(self, mouse_pos, last_dirty=None):
+        """Render the game frame based on current game state
+        
+        Returns the screen areas drawn over the static map during gameplay, or
+        None when the frame has to be presented in full. Passing the previous
+        frame's areas back in as last_dirty lets a gameplay frame restore just
+        those areas of the map instead of redrawing the whole screen.
+        """
+        dirty = None
+        
+        # The map is only redrawn in full when the last frame's areas are unknown
+        if self.game_state != PLAYING or not self.game_map or last_dirty is None:
+            self.screen.fill((BLACK))  # Or your preferred fallback color
         
         # PLAYING state - draw the game
         if self.game_state == PLAYING:
@@ -444,29 +491,38 @@ class Game:
                 blit_x = (win_width - map_width) // 2
                 blit_y = (win_height - map_height) // 2
 
-                # Draw the map centered
-                self.screen.blit(self.game_map.map_surface, (blit_x, blit_y))
+                # Draw the map centered, or just put it back where the last frame drew over it
+                if last_dirty is None:
+                    self.screen.blit(self.game_map.map_surface, (blit_x, blit_y))
+                else:
+                    for rect in last_dirty:
+                        self.screen.fill(BLACK, rect)
+                    self.screen.blits(
+                        [(self.game_map.map_surface, rect, rect.move(-blit_x, -blit_y)) for rect in last_dirty],
+                        doreturn=False
+                    )
                 
                 # Draw debug information if debug mode is enabled
                 if self.debug_mode:
                     self.game_map.draw_debug_spawn_points(self.screen, blit_x, blit_y)
                     self.game_map.draw_debug_walkable(self.screen, blit_x, blit_y)
                 
-                # Draw game entities with offset
+                # Draw game entities with offset, collecting the areas they cover
                 # Draw customers with offset
+                dirty = []
                 for customer in self.customers:
-                    customer.draw(self.screen, blit_x, blit_y)
+                    dirty += customer.draw(self.screen, blit_x, blit_y)
                 
                 # Draw player with offset
-                self.player.draw(self.screen, blit_x, blit_y)
+                dirty.append(self.player.draw(self.screen, blit_x, blit_y))
                 
-                # Draw foods with offset (individual draws instead of group draw)
-                for food in self.foods:
-                    food.draw(self.screen, blit_x, blit_y)
+                # Draw foods with offset in one batched blit
+                dirty += self.screen.blits(
+                    [(food.image, (food.rect.x + blit_x, food.rect.y + blit_y)) for food in self.foods]
+                )
                 
                 # Draw particles with offset
-                for particle in self.particles:
-                    particle.draw(self.screen, blit_x, blit_y)
+                dirty += self.particles.draw(self.screen, blit_x, blit_y)
             else:
                 # Fallback without offsets if map failed to load
                 self.screen.fill((0, 0, 0))
@@ -479,22 +535,23 @@ class Game:
                 self.particles.draw(self.screen)
             
             # Draw player stats
-            self.player.draw_stats(self.screen)
+            hud = self.player.draw_stats(self.screen)
             
             # Draw score
-            score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-            self.screen.blit(score_text, (WIDTH - 150, 20))
+            hud.append(self.screen.blit(self._render_hud_text('score', f"Score: {self.score}"), (WIDTH - 150, 20)))
             
             # Draw game time
             minutes = int(self.game_time) // 60
             seconds = int(self.game_time) % 60
-            time_text = self.font.render(f"Time: {minutes:02d}:{seconds:02d}", True, WHITE)
-            self.screen.blit(time_text, (WIDTH - 150, 60))
+            hud.append(self.screen.blit(self._render_hud_text('time', f"Time: {minutes:02d}:{seconds:02d}"), (WIDTH - 150, 60)))
             
-            # Draw debug mode indicator if active
+            # Draw debug mode indicator if active (the debug overlays cover the whole
+            # map, so debug frames are always presented in full)
             if self.debug_mode:
-                debug_text = self.font.render("DEBUG MODE", True, YELLOW)
-                self.screen.blit(debug_text, (WIDTH - 150, 100))
+                self.screen.blit(render_text("DEBUG MODE", 36, YELLOW), (WIDTH - 150, 100))
+                dirty = None
+            elif dirty is not None:
+                dirty += hud
         
         # MENU state - draw the menu
         elif self.game_state == MENU:
@@ -530,3 +587,5 @@ class Game:
             # Update and draw restart button
             self.restart_button.update(mouse_pos)
             self.restart_button.draw(self.screen)
+        
+        return dirty
@@ -2,16 +2,86 @@ import pygame
 import os
 import pytmx
 import traceback
-from pytmx.util_pygame import load_pygame
+from xml.etree import ElementTree
+from pytmx.util_pygame import handle_transformation
 from src.core.constants import *
 from src.debug.logger import log, log_error, log_asset_load
 
+# Spacing in pixels between the points sampled for the walkability cache
+WALKABLE_CACHE_STEP = 8
+
+# Rendered map surfaces saved between runs, so unchanged maps skip re-blitting every tile
+MAP_CACHE_DIR = os.path.join(BASE_DIR, "cache", "maps")
+
 # Resource loader class to handle tile resources
 class ResourceLoader:
+    # Checkerboard tile shared by every missing resource, built on first use
+    _placeholder = None
+    
+    # Loaded images keyed by absolute path, shared by every loader so reloading a map
+    # (or another map using the same tileset) never decodes the same file twice
+    _images = {}
+    
     def __init__(self, base_path):
         self.base_path = base_path
+        
+        # Requested filenames known to be missing
+        self._missing = set()
+
+    @classmethod
+    def _get_placeholder(cls):
+        """Get the missing-texture checkerboard, creating it the first time it's needed"""
+        if cls._placeholder is None:
+            fallback = pygame.Surface((32, 32), pygame.SRCALPHA)
+            # Create a checkerboard pattern to indicate missing texture
+            colors = [(255, 0, 255), (0, 0, 0)]  # Magenta and black
+            tile_size = 8
+            for y in range(0, 32, tile_size):
+                for x in range(0, 32, tile_size):
+                    color_idx = ((x // tile_size) + (y // tile_size)) % 2
+                    fallback.fill(colors[color_idx], (x, y, tile_size, tile_size))
+            cls._placeholder = fallback
+        return cls._placeholder
+
+    @staticmethod
+    def _convert(image, colorkey=None):
+        """Convert an image to the display format, keeping per-pixel alpha only if it uses any"""
+        if colorkey:
+            image = image.convert()
+            image.set_colorkey(colorkey, pygame.RLEACCEL)
+            return image
+        width, height = image.get_size()
+        if (image.get_flags() & pygame.SRCALPHA
+                and pygame.mask.from_surface(image, 254).count() < width * height):
+            return image.convert_alpha()
+        return image.convert()
+
+    def load(self, filename, colorkey=None, **kwargs):
+        """pytmx image loader: returns a function that cuts tiles out of the cached image"""
+        image = self._load_image(filename)
+        if image is None:
+            return lambda rect=None, flags=None: self._get_placeholder()
+        
+        # Tiled stores the transparent colour as a hex string
+        if colorkey:
+            colorkey = pygame.Color(f"#{colorkey}")
+        
+        def load_tile(rect=None, flags=None):
+            # Cut the tile out of the shared image
+            tile = image.subsurface(rect) if rect else image.copy()
+            if flags:
+                tile = handle_transformation(tile, flags)
+            # Fully opaque tiles drop the alpha channel so they blit faster
+            return self._convert(tile, colorkey)
+        
+        return load_tile
 
-    def load(self, filename, **_):
+    def _load_image(self, filename):
+        """Find and load an image, or return None if it's missing"""
+        # Skip the path search for resources that were already found missing
+        if filename in self._missing:
+            return None
+        
         print(f"[ResourceLoader] Attempting to load resource: {filename}")
         print(f"[ResourceLoader] Current working directory: {os.getcwd()}")
         # Handle the specific path pattern we're seeing in the error
@@ -37,20 +107,17 @@ class ResourceLoader:
         for path in candidates:
             print(f"[ResourceLoader] Checking path: {path}")
             if os.path.exists(path):
-                print(f"[ResourceLoader] Successfully loaded: {path}")
-                return pygame.image.load(path).convert_alpha()
-                
+                abs_path = os.path.abspath(path)
+                image = self._images.get(abs_path)
+                if image is None:
+                    image = self._images[abs_path] = self._convert(pygame.image.load(abs_path))
+                    print(f"[ResourceLoader] Successfully loaded: {path}")
+                return image
+        
         print(f"[ResourceLoader] WARNING: missing resource {filename}")
-        # Create a fallback tile
-        fallback = pygame.Surface((32, 32), pygame.SRCALPHA)
-        # Create a checkerboard pattern to indicate missing texture
-        colors = [(255, 0, 255), (0, 0, 0)]  # Magenta and black
-        tile_size = 8
-        for y in range(0, 32, tile_size):
-            for x in range(0, 32, tile_size):
-                color_idx = ((x // tile_size) + (y // tile_size)) % 2
-                pygame.draw.rect(fallback, colors[color_idx], (x, y, tile_size, tile_size))
-        return fallback
+        # Tiles from this image fall back to the shared placeholder
+        self._missing.add(filename)
+        return None
 
 
 class TiledMap:
@@ -60,7 +127,8 @@ class TiledMap:
         self.debug_mode = False  # Set this to True for additional debug info
         loader = ResourceLoader(os.path.dirname(tmx_path))
         try:
-            self.tmx_data = load_pygame(tmx_path, image_loader=loader.load)
+            # load_pygame always installs pytmx's own image loader, so build the map directly
+            self.tmx_data = pytmx.TiledMap(tmx_path, image_loader=loader.load)
             print(f"[TiledMap] Successfully loaded TMX: {tmx_path}")
             self.width = self.tmx_data.width * self.tmx_data.tilewidth
             self.height = self.tmx_data.height * self.tmx_data.tileheight
@@ -72,13 +140,17 @@ class TiledMap:
     def _initialize_map_properties(self):
         """Initialize common map properties after loading a TMX file"""
         # Properties for walkable area caching
-        self.walkable_cache = {}
+        self.walkable_grid = None
         self.cache_enabled = True
         self.use_cache = True
         
         # Properties for collision detection
         self.collision_rects = []
-        self.unwalkable_tiles = []
+        self.collision_grid = {}
+        self.unwalkable_tiles = set()
+        self.unwalkable_grid = bytearray(self.tmx_data.width * self.tmx_data.height)
+        self.tile_shift = self._get_tile_shift(self.tmx_data.tilewidth, self.tmx_data.tileheight)
+        self._probe_rect = pygame.Rect(0, 0, 1, 1)
         
         # Properties for spawn points
         self.spawn_points = {}
@@ -86,10 +158,15 @@ class TiledMap:
         # Pre-render the entire tilemap to a surface for better performance
         self.map_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
+        # Collect the visible tile layers once for collision extraction and rendering
+        self.tile_layers = [layer for layer in self.tmx_data.visible_layers
+                            if isinstance(layer, pytmx.TiledTileLayer)]
+        
         # Extract objects and collision info
         self._extract_objects()
+        self._build_collision_grid()
         self._extract_tile_collisions()
-        self._render_layers()
+        self._render_map()
         
         # Pre-compute the walkable areas
         if self.cache_enabled:
@@ -130,23 +207,28 @@ class TiledMap:
         self.tmx_data = FakeTmxData()
         
         # Initialize basic properties
-        self.walkable_cache = {}
+        self.walkable_grid = None
         self.cache_enabled = True
         self.use_cache = True
         self.collision_rects = []
-        self.unwalkable_tiles = []
+        self.collision_grid = {}
+        self.unwalkable_tiles = set()
+        self.unwalkable_grid = bytearray(width * height)
+        self.tile_shift = self._get_tile_shift(cell_size, cell_size)
+        self._probe_rect = pygame.Rect(0, 0, 1, 1)
+        self.tile_layers = []
         self.spawn_points = {}
         
         # Create a map surface
         self.map_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
-        # Draw a grid
+        # Draw a grid (solid cells use fill, which skips draw.rect's shape handling)
         for x in range(width):
             for y in range(height):
                 rect = pygame.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
                 # Make the edges of the map unwalkable
                 if x == 0 or y == 0 or x == width-1 or y == height-1:
-                    pygame.draw.rect(self.map_surface, (100, 100, 100), rect)
+                    self.map_surface.fill((100, 100, 100), rect)
                     self.collision_rects.append(rect)
                 else:
                     # Alternate colors for tiles
@@ -154,10 +236,16 @@ class TiledMap:
                         color = (200, 230, 200)  # Light green
                     else:
                         color = (180, 210, 180)  # Slightly darker green
-                    pygame.draw.rect(self.map_surface, color, rect)
+                    self.map_surface.fill(color, rect)
                     
                 # Draw grid lines
                 pygame.draw.rect(self.map_surface, (150, 150, 150), rect, 1)
+        self._convert_map_surface()
+        
+        # Index the edge collision rectangles by tile and pre-compute the walkable areas
+        self._build_collision_grid()
+        if self.cache_enabled:
+            self.cache_walkable_areas()
         
         # Add spawn points around the center
         center_x, center_y = self.width // 2, self.height // 2
@@ -176,8 +264,8 @@ class TiledMap:
         and mark those tiles as unwalkable. It also maintains backward compatibility
         with the layer-based collision detection system.
         """
-        # Clear existing unwalkable tiles
-        self.unwalkable_tiles = []
+        # Clear existing unwalkable tiles (a set, so lookups are O(1) and duplicates collapse)
+        self.unwalkable_tiles = set()
         
         # For backward compatibility: layer names that are considered unwalkable
         unwalkable_layer_names = ['collision', 'unwalkable', 'ocean']
@@ -187,32 +275,35 @@ class TiledMap:
         collision_count = 0
         
         # Iterate through all visible tile layers
-        for layer in self.tmx_data.visible_layers:
-            # Check if it's a tile layer
-            if hasattr(layer, 'data'):
-                # Check if entire layer is unwalkable (for backward compatibility)
-                layer_is_unwalkable = (hasattr(layer, 'name') and 
-                                     layer.name is not None and 
-                                     layer.name.lower() in unwalkable_layer_names)
-                
-                # Check each tile in the layer
-                for x, y, gid in layer:
-                    if gid == 0:  # Skip empty tiles
-                        continue
-                        
-                    # Check if this tile has the 'collides' property
-                    properties = self.tmx_data.get_tile_properties_by_gid(gid)
+        for layer in self.tile_layers:
+            # Check if entire layer is unwalkable (for backward compatibility)
+            layer_is_unwalkable = (layer.name is not None and 
+                                   layer.name.lower() in unwalkable_layer_names)
+            
+            # Check each tile in the layer
+            for x, y, gid in layer:
+                if gid == 0:  # Skip empty tiles
+                    continue
                     
-                    # Add tile to unwalkable list if:
-                    # 1. The tile has 'collides' property set to True, OR
-                    # 2. The layer is entirely unwalkable (for backward compatibility)
-                    if ((properties and properties.get('collides', False)) or 
-                        layer_is_unwalkable):
-                        self.unwalkable_tiles.append((x, y))
-                        collision_count += 1
-        
-        # Log the result for debugging
-        log(f"Extracted {collision_count} unwalkable tiles")
+                # Check if this tile has the 'collides' property
+                properties = self.tmx_data.get_tile_properties_by_gid(gid)
+                
+                # Add tile to unwalkable list if:
+                # 1. The tile has 'collides' property set to True, OR
+                # 2. The layer is entirely unwalkable (for backward compatibility)
+                if ((properties and properties.get('collides', False)) or 
+                    layer_is_unwalkable):
+                    self.unwalkable_tiles.add((x, y))
+                    collision_count += 1
+        
+        # Flatten the set into a row-major byte per tile for direct indexing in walkability checks
+        map_width = self.tmx_data.width
+        self.unwalkable_grid = bytearray(map_width * self.tmx_data.height)
+        for x, y in self.unwalkable_tiles:
+            self.unwalkable_grid[y * map_width + x] = 1
+        
+        # Log the result for debugging (tiles flagged by several layers are stored once)
+        log(f"Extracted {collision_count} unwalkable tiles ({len(self.unwalkable_tiles)} unique)")
         
     def _extract_objects(self):
         """Extracts collision and interactable objects from the TMX file"""
@@ -241,6 +332,83 @@ class TiledMap:
                     
                     self.spawn_points[spawn_type].append((obj.x, obj.y))
 
+    def _build_collision_grid(self):
+        """Bucket collision rectangles by the tiles they cover
+        
+        Walkability checks then only test the rectangles that overlap the
+        queried point's tile instead of scanning every collision rectangle.
+        """
+        self.collision_grid = {}
+        tile_width = self.tmx_data.tilewidth
+        tile_height = self.tmx_data.tileheight
+        
+        for rect in self.collision_rects:
+            for tile_x in range(rect.left // tile_width, (rect.right - 1) // tile_width + 1):
+                for tile_y in range(rect.top // tile_height, (rect.bottom - 1) // tile_height + 1):
+                    self.collision_grid.setdefault((tile_x, tile_y), []).append(rect)
+    
+    def _render_map(self):
+        """Render the map surface, reusing the copy saved on disk by an earlier run"""
+        cache_path = self._get_render_cache_path()
+        if cache_path and os.path.exists(cache_path):
+            try:
+                cached = pygame.image.load(cache_path)
+                if cached.get_size() == (self.width, self.height):
+                    self.map_surface = cached
+                    self._convert_map_surface()
+                    log(f"Loaded rendered map from cache: {cache_path}")
+                    return
+            except pygame.error as e:
+                log_error(f"Could not read cached map render {cache_path}: {e}")
+        
+        self._render_layers()
+        if not cache_path:
+            return
+        
+        # Save the result for the next run (a failure here only costs the next load time)
+        try:
+            os.makedirs(MAP_CACHE_DIR, exist_ok=True)
+            pygame.image.save(self.map_surface, cache_path)
+            self._remove_stale_renders(cache_path)
+        except (OSError, pygame.error) as e:
+            log_error(f"Could not cache map render to {cache_path}: {e}")
+    
+    def _get_render_cache_path(self):
+        """Get the render cache file for this map, or None if it can't be cached
+        
+        The file name includes the newest modification time of the TMX file, its
+        external tileset files and their images, so editing any of them renders the
+        map afresh. If any of them can't be found the map isn't cached at all.
+        """
+        tmx_path = self.tmx_data.filename
+        map_dir = os.path.dirname(tmx_path)
+        sources = [tmx_path]
+        try:
+            # pytmx doesn't keep the paths of external .tsx files, so read them from the TMX
+            for tileset in ElementTree.parse(tmx_path).getroot().iter("tileset"):
+                if tileset.get("source"):
+                    sources.append(os.path.join(map_dir, tileset.get("source")))
+            sources += [os.path.join(map_dir, tileset.source)
+                        for tileset in self.tmx_data.tilesets if tileset.source]
+            mtime = max(os.stat(path).st_mtime_ns for path in sources)
+        except (OSError, ElementTree.ParseError) as e:
+            log_error(f"Not caching map render, could not check its sources: {e}")
+            return None
+        name = os.path.splitext(os.path.basename(tmx_path))[0]
+        return os.path.join(MAP_CACHE_DIR, f"{name}_{mtime}.png")
+    
+    def _remove_stale_renders(self, cache_path):
+        """Delete renders of this map saved under older source modification times"""
+        name = os.path.splitext(os.path.basename(self.tmx_data.filename))[0]
+        for filename in os.listdir(MAP_CACHE_DIR):
+            stem, ext = os.path.splitext(filename)
+            # Match only "<name>_<mtime>.png", not maps whose names start with this one
+            if (ext == ".png" and stem.startswith(f"{name}_")
+                    and stem[len(name) + 1:].isdigit()):
+                path = os.path.join(MAP_CACHE_DIR, filename)
+                if path != cache_path:
+                    os.remove(path)
+    
     def _render_layers(self):
         """Render all tile layers to a single surface"""
         # First, fill the entire map surface with a solid color
@@ -252,35 +420,86 @@ class TiledMap:
         # Log the rendering process
         log("Rendering map layers...")
         
-        # Loop through all visible tile layers and render them in order (bottom to top)
-        for layer in self.tmx_data.visible_layers:
-            if hasattr(layer, 'data'):
-                # This is a tile layer
-                for x, y, gid in layer:
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        # Calculate the position to draw the tile
-                        pos_x = x * self.tmx_data.tilewidth
-                        pos_y = y * self.tmx_data.tileheight
-                        self.map_surface.blit(tile, (pos_x, pos_y))
+        # Pixel offset of each tile column and row
+        xs = range(0, self.width, self.tmx_data.tilewidth)
+        ys = range(0, self.height, self.tmx_data.tileheight)
+        # Tile images indexed by gid (gid 0 and unused gids hold None); layer gids are
+        # always valid indices, so skip get_tile_image_by_gid's per-call checks
+        images = self.tmx_data.images
+        
+        # Draw every visible tile layer in order (bottom to top) in a single batch,
+        # feeding the tiles to blits lazily instead of building a list per layer
+        self.map_surface.blits(
+            ((images[gid], (xs[x], ys[y]))
+             for layer in self.tile_layers
+             for x, y, gid in layer
+             if images[gid]),
+            doreturn=False
+        )
+        
+        # The map is fully opaque, so match the display format for fast per-frame blits
+        self._convert_map_surface()
         
         # Log completion
         log("Map rendering complete")
     
+    def _convert_map_surface(self):
+        """Convert the rendered map surface to the display's pixel format without alpha"""
+        if pygame.display.get_surface() is not None:
+            self.map_surface = self.map_surface.convert()
+    
     def cache_walkable_areas(self):
-        """Pre-compute walkable areas for better performance"""
-        # This can be expensive for large maps, so you might want to optimize further
+        """Pre-compute walkable areas for better performance
+        
+        The grid starts out fully walkable, then every unwalkable tile and
+        collision rectangle clears the samples it covers with one slice
+        assignment per row, instead of checking each sample individually.
+        """
         log("Caching walkable areas...")
         
         # We'll check every Nth pixel to reduce computation
-        step = 8
-        
-        for x in range(0, self.width, step):
-            for y in range(0, self.height, step):
-                # Check if the position is walkable and cache the result
-                self.walkable_cache[(x, y)] = self._check_walkability(x, y)
+        step = WALKABLE_CACHE_STEP
+        cols = self.walkable_cols = len(range(0, self.width, step))
+        rows = self.walkable_rows = len(range(0, self.height, step))
+        
+        # One byte per sampled point, stored row by row
+        grid = bytearray(b'\x01') * (cols * rows)
+        
+        # Unwalkable areas as (left, top, width, height) in pixels
+        tile_width = self.tmx_data.tilewidth
+        tile_height = self.tmx_data.tileheight
+        areas = [(tile_x * tile_width, tile_y * tile_height, tile_width, tile_height)
+                 for tile_x, tile_y in self.unwalkable_tiles]
+        areas.extend((rect.x, rect.y, rect.width, rect.height) for rect in self.collision_rects)
+        
+        for left, top, width, height in areas:
+            first_col, last_col = self._sample_span(left, left + width, cols)
+            first_row, last_row = self._sample_span(top, top + height, rows)
+            if first_col >= last_col:
+                continue
+            
+            blocked = bytes(last_col - first_col)
+            for row in range(first_row, last_row):
+                start = row * cols
+                grid[start + first_col:start + last_col] = blocked
         
-        log(f"Walkability cache built with {len(self.walkable_cache)} entries")
+        self.walkable_grid = grid
+        log(f"Walkability cache built with {len(grid)} entries")
+    
+    @staticmethod
+    def _get_tile_shift(tile_width, tile_height):
+        """Get the bit shift converting pixels to tiles, or None unless tiles are square powers of two"""
+        if tile_width == tile_height and tile_width > 0 and tile_width & (tile_width - 1) == 0:
+            return tile_width.bit_length() - 1
+        return None
+    
+    @staticmethod
+    def _sample_span(start, end, count):
+        """Get the range of sample indices whose points lie in the pixel span [start, end)"""
+        step = WALKABLE_CACHE_STEP
+        first = max(0, -(-start // step))
+        last = min(count, -(-end // step))
+        return first, last
     
     def _check_walkability(self, x, y):
         """Helper method to check if a position is walkable
@@ -294,20 +513,31 @@ class TiledMap:
         if x < 0 or y < 0 or x >= self.width or y >= self.height:
             return False
         
-        # Check collision with collision rectangles
-        for rect in self.collision_rects:
-            if rect.collidepoint(x, y):
-                return False
-        
         # Convert pixel position to tile indices
-        tile_x = int(x // self.tmx_data.tilewidth)
-        tile_y = int(y // self.tmx_data.tileheight)
+        # (position is non-negative here, so truncating and shifting floors it)
+        tile_shift = self.tile_shift
+        if tile_shift is not None:
+            tile_x = int(x) >> tile_shift
+            tile_y = int(y) >> tile_shift
+        else:
+            tile_x = int(x // self.tmx_data.tilewidth)
+            tile_y = int(y // self.tmx_data.tileheight)
+        
+        # Check collision with the collision rectangles covering this tile
+        # (the probe rect is reused; Rect attributes round floats, so truncate like collidepoint)
+        bucket = self.collision_grid.get((tile_x, tile_y))
+        if bucket:
+            probe = self._probe_rect
+            probe.x = int(x)
+            probe.y = int(y)
+            if probe.collidelist(bucket) != -1:
+                return False
         
-        # Check if the tile is in the unwalkable list
-        # This list is populated with tiles that either:
+        # Check if the tile is marked in the unwalkable grid
+        # This grid is populated with tiles that either:
         # 1. Have collides=True property in Tiled, or
         # 2. Are in a layer marked as unwalkable
-        if (tile_x, tile_y) in self.unwalkable_tiles:
+        if self.unwalkable_grid[tile_y * self.tmx_data.width + tile_x]:
             return False
         
         # If we got here, position is walkable
@@ -316,14 +546,14 @@ class TiledMap:
     def is_walkable(self, x, y):
         """Check if a position is walkable, using cache when possible"""
         # Round to nearest cached point if cache is enabled
-        if self.use_cache and self.cache_enabled:
+        if self.use_cache and self.cache_enabled and self.walkable_grid is not None:
             # Find the nearest cached point
-            step = 8
-            cache_x = round(x / step) * step
-            cache_y = round(y / step) * step
+            step = WALKABLE_CACHE_STEP
+            grid_x = int((x + step / 2) // step)
+            grid_y = int((y + step / 2) // step)
             
-            if (cache_x, cache_y) in self.walkable_cache:
-                return self.walkable_cache[(cache_x, cache_y)]
+            if 0 <= grid_x < self.walkable_cols and 0 <= grid_y < self.walkable_rows:
+                return bool(self.walkable_grid[grid_y * self.walkable_cols + grid_x])
         
         # Fall back to computing walkability directly
         return self._check_walkability(x, y)
@@ -392,47 +622,47 @@ class TiledMap:
     
     def draw_debug_spawn_points(self, surface, offset_x=0, offset_y=0):
         """Draw visual indicators for spawn points to help with debugging"""
-        # Loop through all spawn point categ    ories
+        # Loop through all spawn point categories
         for spawn_type, positions in self.spawn_points.items():
             # Make sure spawn_type is a string before calling lower()
             spawn_type_str = str(spawn_type).lower() if spawn_type is not None else ''
-        
-        # Use different colors for different spawn types
-        if 'customer' in spawn_type_str:
-            color = (0, 255, 0)  # Green for customer spawns
-        elif 'player' in spawn_type_str:
-            color = (0, 0, 255)  # Blue for player spawns
-        else:
-            color = (255, 255, 0)  # Yellow for other spawns
-        
-        # Draw each spawn point with offset
-        for pos in positions:
-            # Apply offset to position
-            draw_pos = (pos[0] + offset_x, pos[1] + offset_y)
-            pygame.draw.circle(surface, color, draw_pos, 10, 2)  # Outline
-            pygame.draw.circle(surface, color, draw_pos, 2)      # Center dot
-
-def draw_debug_walkable(self, surface, offset_x=0, offset_y=0):
-    """Draw walkable/unwalkable areas for debugging"""
-    # Use a grid approach instead of checking every pixel
-    grid_size = 20  # Check every 20 pixels
-    rect_size = 5   # Size of the indicator squares
-    
-    for x in range(0, self.width, grid_size):
-        for y in range(0, self.height, grid_size):
-            # Apply offset to coordinates
-            draw_x = x + offset_x
-            draw_y = y + offset_y
             
-            if self.is_walkable(x, y):
-                # Draw green dot for walkable area
-                pygame.draw.rect(surface, (0, 255, 0, 128), 
-                               (draw_x - rect_size//2, draw_y - rect_size//2, rect_size, rect_size))
+            # Use different colors for different spawn types
+            if 'customer' in spawn_type_str:
+                color = (0, 255, 0)  # Green for customer spawns
+            elif 'player' in spawn_type_str:
+                color = (0, 0, 255)  # Blue for player spawns
             else:
-                # Draw red X for unwalkable area
-                pygame.draw.line(surface, (255, 0, 0, 192), 
-                               (draw_x - rect_size//2, draw_y - rect_size//2), 
-                               (draw_x + rect_size//2, draw_y + rect_size//2), 2)
-                pygame.draw.line(surface, (255, 0, 0, 192), 
-                               (draw_x + rect_size//2, draw_y - rect_size//2), 
-                               (draw_x - rect_size//2, draw_y + rect_size//2), 2)
+                color = (255, 255, 0)  # Yellow for other spawns
+            
+            # Draw each spawn point with offset
+            for pos in positions:
+                # Apply offset to position
+                draw_pos = (pos[0] + offset_x, pos[1] + offset_y)
+                pygame.draw.circle(surface, color, draw_pos, 10, 2)  # Outline
+                pygame.draw.circle(surface, color, draw_pos, 2)      # Center dot
+    
+    def draw_debug_walkable(self, surface, offset_x=0, offset_y=0):
+        """Draw walkable/unwalkable areas for debugging"""
+        # Use a grid approach instead of checking every pixel
+        grid_size = 20  # Check every 20 pixels
+        rect_size = 5   # Size of the indicator squares
+    
+        for x in range(0, self.width, grid_size):
+            for y in range(0, self.height, grid_size):
+                # Apply offset to coordinates
+                draw_x = x + offset_x
+                draw_y = y + offset_y
+            
+                if self.is_walkable(x, y):
+                    # Draw green dot for walkable area
+                    pygame.draw.rect(surface, (0, 255, 0, 128), 
+                                   (draw_x - rect_size//2, draw_y - rect_size//2, rect_size, rect_size))
+                else:
+                    # Draw red X for unwalkable area
+                    pygame.draw.line(surface, (255, 0, 0, 192), 
+                                   (draw_x - rect_size//2, draw_y - rect_size//2), 
+                                   (draw_x + rect_size//2, draw_y + rect_size//2), 2)
+                    pygame.draw.line(surface, (255, 0, 0, 192), 
+                                   (draw_x + rect_size//2, draw_y - rect_size//2), 
+                                   (draw_x - rect_size//2, draw_y + rect_size//2), 2)
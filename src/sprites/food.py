@@ -4,123 +4,164 @@ import random
 import math
 from src.core.constants import *
 
+# Food types and their corresponding image base names
+FOOD_BASE_NAMES = {
+    'pizza': 'Tropical_Pizza_Slice',
+    'smoothie': 'Ska_Smoothie',
+    'icecream': 'Island_Ice_Cream',
+    'pudding': 'Rasta_Rice_Pudding',
+    'rasgulla': 'Reggae_Rasgulla'
+}
+
+# Handle special cases with different naming patterns
+# For Ska_Smoothie, the files may just be named Ska1.png, etc.
+FOOD_FILE_PREFIXES = {
+    'Ska_Smoothie': 'Ska'
+}
+
+# Number of numbered sprite variants shipped for each food type
+FOOD_VARIANT_COUNT = 5
+
+# Preloaded sprite variants for each food type, filled once by Food.preload_frames()
+_FOOD_FRAMES = {}
+
+# Color used as the transparent colorkey for hard-edged food sprites
+FOOD_COLORKEY = (255, 0, 255)
+
+
+def _convert_food_image(image):
+    """Convert a food sprite to the fastest display format that keeps its transparency
+    
+    Sprites whose pixels are all either fully opaque or fully transparent are
+    converted with a colorkey, which SDL blits much faster than per-pixel alpha.
+    Sprites with soft (antialiased) edges, or with opaque pixels that are already
+    the colorkey color, keep their per-pixel alpha.
+    """
+    image = image.convert_alpha()
+    
+    # Compare pixels with any alpha against fully opaque pixels
+    visible = pygame.mask.from_surface(image, 0).count()
+    opaque_mask = pygame.mask.from_surface(image, 254)
+    if visible != opaque_mask.count():
+        return image
+    
+    # Opaque pixels of exactly the key color would turn transparent
+    key_mask = pygame.mask.from_threshold(image, FOOD_COLORKEY, (1, 1, 1, 255))
+    if key_mask.overlap_area(opaque_mask, (0, 0)):
+        return image
+    
+    keyed = pygame.Surface(image.get_size())
+    keyed.fill(FOOD_COLORKEY)
+    keyed.blit(image, (0, 0))
+    keyed = keyed.convert()
+    keyed.set_colorkey(FOOD_COLORKEY, pygame.RLEACCEL)
+    return keyed
+
+
+def _create_fallback_food_image(food_type):
+    """Create a fallback food sprite (colored shape) for a food type"""
+    image = pygame.Surface((32, 32), pygame.SRCALPHA)
+    
+    # Different colors for different food types
+    if food_type == 'pizza':
+        color = (255, 200, 0)  # Yellow
+        pygame.draw.circle(image, color, (16, 16), 16)
+        pygame.draw.polygon(image, (200, 0, 0), [(8, 8), (24, 8), (16, 24)])
+    elif food_type == 'smoothie':
+        color = (200, 0, 200)  # Purple
+        pygame.draw.rect(image, color, (8, 4, 16, 24))
+        pygame.draw.circle(image, (255, 255, 255), (16, 6), 6)
+    elif food_type == 'icecream':
+        color = (200, 255, 255)  # Light blue
+        pygame.draw.polygon(image, (240, 220, 180), [(8, 28), (24, 28), (16, 10)])
+        pygame.draw.circle(image, color, (16, 8), 8)
+    elif food_type == 'pudding':
+        color = (240, 220, 180)  # Tan
+        pygame.draw.ellipse(image, color, (4, 8, 24, 16))
+        pygame.draw.circle(image, (150, 50, 0), (16, 16), 4)
+    else:
+        color = (255, 0, 0)  # Default red
+        pygame.draw.circle(image, color, (16, 16), 16)
+    
+    return _convert_food_image(image)
+
+
+def _load_food_frames(food_type):
+    """Load the sprite variants for one food type into the shared table and return them
+    
+    Missing sprites are reported once here, and a food type with no sprites at
+    all (including unknown types) gets a fallback sprite instead.
+    """
+    base_name = FOOD_BASE_NAMES.get(food_type)
+    frames = []
+    missing = []
+    
+    if base_name is not None:
+        food_dir = os.path.join(ASSETS_DIR, 'Food', base_name)
+        file_prefix = FOOD_FILE_PREFIXES.get(base_name, base_name)
+        
+        for i in range(1, FOOD_VARIANT_COUNT + 1):
+            # First try with the special case name, then the standard name
+            candidates = [os.path.join(food_dir, f"{file_prefix}{i}.png")]
+            if file_prefix != base_name:
+                candidates.append(os.path.join(food_dir, f"{base_name}{i}.png"))
+            
+            path = next((c for c in candidates if os.path.exists(c)), None)
+            if path is None:
+                missing.append(candidates[-1])
+                continue
+            
+            try:
+                image = pygame.transform.scale(pygame.image.load(path), (32, 32))  # Scale to appropriate size
+                frames.append(_convert_food_image(image))
+            except pygame.error as e:
+                print(f"Error loading food sprite {path}: {e}")
+                missing.append(path)
+    
+    if missing:
+        print(f"Missing {len(missing)} {food_type} sprite(s), using fallbacks where needed:")
+        for path in missing:
+            print(f"  {path}")
+    
+    # If no image was found, use the fallback sprite for this type
+    frames = _FOOD_FRAMES[food_type] = frames or [_create_fallback_food_image(food_type)]
+    return frames
+
+
 class Food(pygame.sprite.Sprite):
     def __init__(self, x, y, dx, dy, food_type='pizza'):
         super().__init__()
         self.food_type = food_type
         
-        # Food types and their corresponding image base names
-        food_base_names = {
-            'pizza': 'Tropical_Pizza_Slice',
-            'smoothie': 'Ska_Smoothie',
-            'icecream': 'Island_Ice_Cream',
-            'pudding': 'Rasta_Rice_Pudding',
-            'rasgulla': 'Reggae_Rasgulla'
-        }
-        
         # Maintain a class-level counter for cycling through food sprites
         if not hasattr(Food, 'cycle_counter'):
             Food.cycle_counter = {}
-            
-        # Try to load the food sprite with cycling through variants
-        try:
-            base_name = food_base_names.get(food_type, 'food')
-            print(f"Loading food sprite for type: {food_type}, base name: {base_name}")
-            
-            # Initialize the cycle counter for this food type if it doesn't exist
-            if food_type not in Food.cycle_counter:
-                Food.cycle_counter[food_type] = 1
-            else:
-                # Cycle to the next number (1-5)
-                Food.cycle_counter[food_type] = (Food.cycle_counter[food_type] % 5) + 1
-            
-            # Get the current cycle number for this food type
-            cycle_num = Food.cycle_counter[food_type]
-            
-            # Try to load the corresponding numbered PNG
-            self.image = None
-            
-            # Handle special cases with different naming patterns
-            special_cases = {
-                'Ska_Smoothie': 'Ska'  # For Ska_Smoothie, the files are just named Ska1.png, etc.
-            }
-            
-            # Check if this food type has a special naming case
-            file_prefix = special_cases.get(base_name, base_name)
-            
-            # First try with the special case name if applicable
-            preferred_path = os.path.join(ASSETS_DIR, 'Food', base_name, f"{file_prefix}{cycle_num}.png")
-            print(f"Trying to load cycle {cycle_num}: {preferred_path}")
-            
-            if os.path.exists(preferred_path):
-                self.image = pygame.image.load(preferred_path).convert_alpha()
-                print(f"Loaded food image: {file_prefix}{cycle_num}.png")
-            else:
-                # Fallback to other numbers and naming patterns if this one doesn't exist
-                food_dir = os.path.join(ASSETS_DIR, 'Food', base_name)
-                if os.path.isdir(food_dir):
-                    # First try with special case naming
-                    for i in range(1, 6):
-                        alt_path = os.path.join(food_dir, f"{file_prefix}{i}.png")
-                        if os.path.exists(alt_path):
-                            self.image = pygame.image.load(alt_path).convert_alpha()
-                            print(f"Loaded alternate food image: {file_prefix}{i}.png")
-                            break
-                        
-                    # If still not found, try standard naming as a last resort
-                    if not self.image and file_prefix != base_name:
-                        alt_path = os.path.join(food_dir, f"{base_name}{cycle_num}.png")
-                        if os.path.exists(alt_path):
-                            self.image = pygame.image.load(alt_path).convert_alpha()
-                            print(f"Loaded with standard name: {base_name}{cycle_num}.png")
-            
-            # If image was found, scale it to the appropriate size
-            if self.image:
-                self.image = pygame.transform.scale(self.image, (32, 32))  # Scale to appropriate size
-            else:
-                # If no image was found, raise an exception to trigger the fallback
-                raise FileNotFoundError(f"Could not find food image for {food_type}")
-        except Exception as e:
-            print(f"Error loading food sprite: {e}")
-            print("Using fallback food sprite")
-            
-            # Create a fallback food sprite (colored circle)
-            self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
-            
-            # Different colors for different food types
-            if food_type == 'pizza':
-                color = (255, 200, 0)  # Yellow
-                pygame.draw.circle(self.image, color, (16, 16), 16)
-                pygame.draw.polygon(self.image, (200, 0, 0), [(8, 8), (24, 8), (16, 24)])
-            elif food_type == 'smoothie':
-                color = (200, 0, 200)  # Purple
-                pygame.draw.rect(self.image, color, (8, 4, 16, 24))
-                pygame.draw.circle(self.image, (255, 255, 255), (16, 6), 6)
-            elif food_type == 'icecream':
-                color = (200, 255, 255)  # Light blue
-                pygame.draw.polygon(self.image, (240, 220, 180), [(8, 28), (24, 28), (16, 10)])
-                pygame.draw.circle(self.image, color, (16, 8), 8)
-            elif food_type == 'pudding':
-                color = (240, 220, 180)  # Tan
-                pygame.draw.ellipse(self.image, color, (4, 8, 24, 16))
-                pygame.draw.circle(self.image, (150, 50, 0), (16, 16), 4)
-            else:
-                color = (255, 0, 0)  # Default red
-                pygame.draw.circle(self.image, color, (16, 16), 16)
+        
+        # Sprites are normally preloaded at startup; otherwise load this type once on first use
+        frames = _FOOD_FRAMES.get(food_type) or _load_food_frames(food_type)
+        
+        # Cycle to the next sprite variant (1-5) for this food type
+        cycle_num = (Food.cycle_counter.get(food_type, 0) % FOOD_VARIANT_COUNT) + 1
+        Food.cycle_counter[food_type] = cycle_num
+        self.image = frames[(cycle_num - 1) % len(frames)]
         
         # Set up the food rectangle
         self.rect = self.image.get_rect(center=(x, y))
         
-        # Velocity components (in pixels per frame)
-        self.direction = pygame.math.Vector2(dx, dy)
-        if self.direction.length() > 0:
-            self.direction.normalize_ip()
-        
         # Speed multiplier
         self.speed = 300  # pixels per second
         
-        # Lifespan (despawn after a few seconds)
-        self.lifespan = 2.0  # seconds
+        # Velocity components (in pixels per second) along the normalized direction
+        magnitude = math.hypot(dx, dy) or 1.0
+        self._vx = dx / magnitude * self.speed
+        self._vy = dy / magnitude * self.speed
+        
+        # Sub-pixel center position, so per-frame movement isn't rounded to whole pixels
+        self._fx = float(self.rect.centerx)
+        self._fy = float(self.rect.centery)
+        
+        # Lifespan (despawn after a few seconds, or as soon as the food is off screen)
+        self.lifespan = min(2.0, self._time_to_leave_screen())  # seconds
         self.timer = 0
         
         # Set up collision radius for more accurate hit detection
@@ -128,19 +169,34 @@ class Food(pygame.sprite.Sprite):
     
     def update(self, dt):
         # Move the food
-        self.rect.x += self.direction.x * self.speed * dt
-        self.rect.y += self.direction.y * self.speed * dt
+        self._fx += self._vx * dt
+        self._fy += self._vy * dt
+        self.rect.center = (self._fx, self._fy)
         
-        # Update timer and check lifespan
+        # Update timer and check lifespan (which already covers leaving the screen)
         self.timer += dt
         if self.timer >= self.lifespan:
             self.kill()
+    
+    def _time_to_leave_screen(self):
+        """Seconds until the food's rect is entirely off screen at its constant velocity
         
-        # Despawn if out of screen bounds
-        if (self.rect.right < 0 or self.rect.left > WIDTH or
-            self.rect.bottom < 0 or self.rect.top > HEIGHT):
-            self.kill()
-            
+        Food flies in a straight line, so this is worked out once at creation
+        instead of bounds-checking the rect every frame.
+        """
+        half_w = self.rect.width / 2
+        half_h = self.rect.height / 2
+        times = []
+        if self._vx > 0:
+            times.append((WIDTH + half_w - self._fx) / self._vx)
+        elif self._vx < 0:
+            times.append((self._fx + half_w) / -self._vx)
+        if self._vy > 0:
+            times.append((HEIGHT + half_h - self._fy) / self._vy)
+        elif self._vy < 0:
+            times.append((self._fy + half_h) / -self._vy)
+        return min(times, default=float('inf'))
+    
     def collides_with(self, other_sprite):
         """Better collision detection using circular hitboxes instead of rectangles"""
         # Calculate distance between centers
@@ -154,6 +210,14 @@ class Food(pygame.sprite.Sprite):
         # Return True if the distance is less than the sum of the two collision radii
         return distance < (self.collision_radius + other_radius)
     
+    @staticmethod
+    def preload_frames():
+        """Load every food sprite variant once so spawning food does no file I/O"""
+        for food_type in FOOD_BASE_NAMES:
+            if food_type not in _FOOD_FRAMES:
+                _load_food_frames(food_type)
+        print(f"Preloaded food sprites for {len(_FOOD_FRAMES)} food types")
+    
     @staticmethod
     def reset_counters():
         """Reset the cycling counters - useful when starting a new game"""
@@ -2,41 +2,113 @@ import pygame
 import random
 from src.core.constants import *
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y, color, size=5, speed=2, lifetime=1):
-        super().__init__()
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-        self.rect = self.image.get_rect(center=(x, y))
-        
-        # Random velocity in all directions
-        self.velocity = [random.uniform(-speed, speed), random.uniform(-speed, speed)]
-        self.lifetime = lifetime  # seconds
-        self.timer = 0
-        self.alpha = 255
-        self.fade_rate = 255 / lifetime
-    
+# Number of alpha levels a particle fades through
+PARTICLE_FADE_STEPS = 32
+
+# Most particles alive at once; spawning past this replaces the oldest particle
+MAX_PARTICLES = 256
+
+# Pre-faded particle images keyed by (color, size); entry k has alpha 255 * k / PARTICLE_FADE_STEPS
+_PARTICLE_FRAMES = {}
+
+
+def _get_fade_frames(color, size):
+    """Get the fade frames for a particle color and size, drawing them on first use"""
+    key = (tuple(color), size)
+    frames = _PARTICLE_FRAMES.get(key)
+    if frames is None:
+        base = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(base, color, (size // 2, size // 2), size // 2)
+        base = base.convert_alpha()
+        frames = []
+        for step in range(PARTICLE_FADE_STEPS + 1):
+            frame = base.copy()
+            frame.set_alpha(255 * step // PARTICLE_FADE_STEPS)
+            frames.append(frame)
+        _PARTICLE_FRAMES[key] = frames
+    return frames
+
+
+class ParticlePool:
+    """All live particles, stored column by column instead of as one sprite each
+
+    Each particle is an index into parallel lists of position, velocity, timer
+    and image, so updating and drawing them is a single loop with no per-particle
+    method calls or sprite group bookkeeping.
+    """
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Remove every particle"""
+        self.xs = []          # Sub-pixel top-left position
+        self.ys = []
+        self.vxs = []         # Velocity in pixels per second
+        self.vys = []
+        self.timers = []      # Seconds alive
+        self.lifetimes = []   # Seconds until removal
+        self.fade_rates = []  # Fade steps lost per second
+        self.frames = []      # Shared fade frames for the particle's color and size
+        self.images = []      # Current fade frame
+
+    def __len__(self):
+        return len(self.xs)
+
+    def spawn(self, x, y, color, size=5, speed=2, lifetime=1):
+        """Add a particle centered on (x, y) moving in a random direction
+
+        speed is given in pixels per frame at 60 FPS.
+        """
+        frames = _get_fade_frames(color, size)
+
+        # Keep the per-frame cost bounded by dropping the oldest particle when full
+        if len(self.xs) >= MAX_PARTICLES:
+            for column in (self.xs, self.ys, self.vxs, self.vys, self.timers,
+                           self.lifetimes, self.fade_rates, self.frames, self.images):
+                del column[0]
+
+        self.xs.append(float(x - size // 2))
+        self.ys.append(float(y - size // 2))
+        self.vxs.append(random.uniform(-speed, speed) * 60)
+        self.vys.append(random.uniform(-speed, speed) * 60)
+        self.timers.append(0)
+        self.lifetimes.append(lifetime)
+        self.fade_rates.append(PARTICLE_FADE_STEPS / lifetime)
+        self.frames.append(frames)
+        self.images.append(frames[PARTICLE_FADE_STEPS])
+
     def update(self, dt):
-        # Move particle
-        self.rect.x += self.velocity[0] * dt * 60  # Scale by dt for consistent speed
-        self.rect.y += self.velocity[1] * dt * 60
-        
-        # Update lifetime timer
-        self.timer += dt
-        
-        # Fade out effect
-        self.alpha = max(0, 255 - (self.timer / self.lifetime) * 255)
-        self.image.set_alpha(int(self.alpha))
-        
-        # Remove when lifetime expires
-        if self.timer >= self.lifetime:
-            self.kill()
-    
+        """Move and fade every particle, dropping the ones whose lifetime has expired"""
+        xs, ys, vxs, vys = self.xs, self.ys, self.vxs, self.vys
+        timers, lifetimes, fade_rates = self.timers, self.lifetimes, self.fade_rates
+        frames, images = self.frames, self.images
+
+        # Compact surviving particles to the front of the columns as we go
+        alive = 0
+        for i in range(len(xs)):
+            timer = timers[i] + dt
+            if timer >= lifetimes[i]:
+                continue
+
+            # Move particle and fade it out
+            xs[alive] = xs[i] + vxs[i] * dt
+            ys[alive] = ys[i] + vys[i] * dt
+            vxs[alive] = vxs[i]
+            vys[alive] = vys[i]
+            timers[alive] = timer
+            lifetimes[alive] = lifetimes[i]
+            fade_rates[alive] = fade_rates[i]
+            frames[alive] = frames[i]
+            images[alive] = frames[i][int(PARTICLE_FADE_STEPS - timer * fade_rates[i])]
+            alive += 1
+
+        # Drop the expired particles left at the end
+        for column in (xs, ys, vxs, vys, timers, lifetimes, fade_rates, frames, images):
+            del column[alive:]
+
     def draw(self, surface, offset_x=0, offset_y=0):
-        """Draw the particle with the specified offset"""
-        # Calculate adjusted position with offset
-        draw_x = self.rect.x + offset_x
-        draw_y = self.rect.y + offset_y
-        
-        # Draw at the adjusted position
-        surface.blit(self.image, (draw_x, draw_y))
+        """Draw every particle with the specified offset, returning the screen areas drawn to"""
+        return surface.blits(
+            [(image, (round(x) + offset_x, round(y) + offset_y))
+             for image, x, y in zip(self.images, self.xs, self.ys)]
+        )
@@ -4,6 +4,7 @@ import os
 from pygame import mixer
 from src.core.constants import *
 from src.sprites.food import Food
+from src.ui.text import get_font
 
 # Create a minimal player for fallback cases where normal loading fails
 def create_fallback_player(x, y):
@@ -39,6 +40,17 @@ def create_fallback_player(x, y):
     return player
 
 class Player(pygame.sprite.Sprite):
+    # Movement keys (arrow, WASD), the axis step they apply and the direction they face
+    MOVE_KEYS = (
+        (pygame.K_LEFT, pygame.K_a, -1, 0, 'left'),
+        (pygame.K_RIGHT, pygame.K_d, 1, 0, 'right'),
+        (pygame.K_UP, pygame.K_w, 0, -1, 'up'),
+        (pygame.K_DOWN, pygame.K_s, 0, 1, 'down'),
+    )
+    
+    # Scale applied to each axis when moving diagonally (1 / sqrt(2))
+    DIAGONAL_SCALE = 1 / math.sqrt(2)
+    
     def __init__(self, x, y):
         super().__init__()
         # Initialize animation dictionaries with default empty lists
@@ -124,38 +136,49 @@ class Player(pygame.sprite.Sprite):
                 # Add the fallback sprite to the animations
                 self.animations[direction].append(fallback)
         
+        # Animation and movement settings
+        self.animation_speed = 0.2  # Seconds per frame
+        self.speed = 200  # pixels per second
+        
+        # Food throwing cooldown
+        self.throw_cooldown = 0.2  # seconds
+        
+        # Set up position, stats and timers
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Reset position, stats and timers for a new game without reloading sprites"""
         # Initialize animation variables
         self.direction = 'down'  # Starting direction
         self.frame_index = 0  # Current animation frame
         self.animation_timer = 0
-        self.animation_speed = 0.2  # Seconds per frame
-        self.frame_index = 0
-        self.animation_speed = 0.2  # seconds per frame
-        self.animation_timer = 0
         
         # Set up player rectangle and initial image
         self.image = self.animations[self.direction][self.frame_index]
         self.rect = self.image.get_rect(center=(x, y))
         
         # Player stats
-        self.speed = 200  # pixels per second
         self.deliveries = 0
         self.missed_deliveries = 0
         self.food_inventory = 99  # Unlimited for now
         
         # Food throwing cooldown
-        self.throw_cooldown = 0.2  # seconds
         self.last_throw_time = 0
+        
+        # Rendered stat text keyed by label, re-rendered only when the value changes
+        self._stat_text = {}
     
     def update(self, dt, customers, foods, game_map=None):
+        # Poll the keyboard once and share the state with movement and animation
+        keys = pygame.key.get_pressed()
+        
         # Handle player movement
-        self.handle_movement(dt, game_map)
+        self.handle_movement(dt, game_map, keys)
         
         # Update animation
-        self.update_animation(dt)
+        self.update_animation(dt, keys)
         
         # Check for spacebar to throw food (like in the original main.py)
-        keys = pygame.key.get_pressed()
         current_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
         
         # Check throw cooldown
@@ -165,57 +188,55 @@ class Player(pygame.sprite.Sprite):
                 # Throw in the direction the player is facing
                 self.throw_food(foods, self.direction)
     
-    def handle_movement(self, dt, game_map=None):
-        keys = pygame.key.get_pressed()
+    def handle_movement(self, dt, game_map=None, keys=None):
+        if keys is None:
+            keys = pygame.key.get_pressed()
         move_x, move_y = 0, 0
         
-        # Calculate movement direction
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            move_x = -1
-            self.direction = 'left'
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            move_x = 1
-            self.direction = 'right'
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            move_y = -1
-            self.direction = 'up'
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            move_y = 1
-            self.direction = 'down'
-        
-        # Normalize diagonal movement
-        if move_x != 0 and move_y != 0:
-            # Pythagorean theorem to normalize movement speed on diagonals
-            move_x /= math.sqrt(2)
-            move_y /= math.sqrt(2)
-        
-        # Apply movement speed
-        dx = move_x * self.speed * dt
-        dy = move_y * self.speed * dt
-        
-        # Boundary checking
-        new_x = self.rect.centerx + dx
-        new_y = self.rect.centery + dy
+        # Calculate movement direction; later keys in the table take priority
+        for key, alt_key, step_x, step_y, direction in self.MOVE_KEYS:
+            if keys[key] or keys[alt_key]:
+                if step_x:
+                    move_x = step_x
+                else:
+                    move_y = step_y
+                self.direction = direction
+        
+        # Nothing to check when no movement key is held
+        if not (move_x or move_y):
+            return
+        
+        # Apply movement speed, normalizing diagonal movement
+        step = self.speed * dt
+        if move_x and move_y:
+            step *= self.DIAGONAL_SCALE
+        
+        # Boundary checking (the rect center is read once rather than per check)
+        rect = self.rect
+        center_x, center_y = rect.center
+        new_x = center_x + move_x * step
+        new_y = center_y + move_y * step
         
         # Check map boundaries and collisions
         if 0 <= new_x <= WIDTH and 0 <= new_y <= HEIGHT:
             # Check walkability if map exists
             if game_map:
                 # Try moving on X axis
-                if game_map.is_walkable(new_x, self.rect.centery):
-                    self.rect.centerx = new_x
+                if game_map.is_walkable(new_x, center_y):
+                    rect.centerx = new_x
+                    center_x = rect.centerx
                 
                 # Try moving on Y axis
-                if game_map.is_walkable(self.rect.centerx, new_y):
-                    self.rect.centery = new_y
+                if game_map.is_walkable(center_x, new_y):
+                    rect.centery = new_y
             else:
                 # No map, just move within screen bounds
-                self.rect.centerx = new_x
-                self.rect.centery = new_y
+                rect.center = (new_x, new_y)
     
-    def update_animation(self, dt):
+    def update_animation(self, dt, keys=None):
         # If not moving, use idle animation
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         is_moving = (
             keys[pygame.K_LEFT] or keys[pygame.K_RIGHT] or 
             keys[pygame.K_UP] or keys[pygame.K_DOWN] or
@@ -284,23 +305,27 @@ class Player(pygame.sprite.Sprite):
         self.last_throw_time = pygame.time.get_ticks() / 1000.0
     
     def draw_stats(self, surface):
-        # Draw player stats (deliveries, missed)
-        font = pygame.font.Font(None, 24)
-        deliveries_text = font.render(f"Deliveries: {self.deliveries}", True, WHITE)
-        surface.blit(deliveries_text, (10, 10))
-        
-        missed_text = font.render(f"Missed: {self.missed_deliveries}/10", True, WHITE)
-        surface.blit(missed_text, (10, 40))
-        
-        # Draw a simple health/warning bar based on missed deliveries
-        warning_width = 150 * (self.missed_deliveries / 10.0)
-        pygame.draw.rect(surface, (100, 100, 100), (10, 70, 150, 15))
-        pygame.draw.rect(surface, (255, 50, 50), (10, 70, warning_width, 15))
+        """Draw player stats (deliveries, missed), returning the screen areas drawn to"""
+        return [
+            surface.blit(self._render_stat('deliveries', f"Deliveries: {self.deliveries}"), (10, 10)),
+            surface.blit(self._render_stat('missed', f"Missed: {self.missed_deliveries}/10"), (10, 40)),
+            # Draw a simple health/warning bar based on missed deliveries (the red part
+            # is drawn over the grey background, so only the background's area matters)
+            pygame.draw.rect(surface, (100, 100, 100), (10, 70, 150, 15)),
+            pygame.draw.rect(surface, (255, 50, 50), (10, 70, 150 * (self.missed_deliveries / 10.0), 15))
+        ]
+    
+    def _render_stat(self, label, text):
+        """Return the rendered stat text, reusing the last surface if the text is unchanged"""
+        cached = self._stat_text.get(label)
+        if cached is None or cached[0] != text:
+            cached = self._stat_text[label] = (text, get_font(24).render(text, True, WHITE))
+        return cached[1]
     
     def draw(self, surface, offset_x=0, offset_y=0):
         # Calculate the adjusted position with offset
         draw_x = self.rect.x + offset_x
         draw_y = self.rect.y + offset_y
         
-        # Draw at the adjusted position
-        surface.blit(self.image, (draw_x, draw_y))
+        # Draw at the adjusted position, returning the screen area drawn to
+        return surface.blit(self.image, (draw_x, draw_y))
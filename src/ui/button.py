@@ -1,5 +1,6 @@
 import pygame
 from src.core.constants import WHITE
+from src.ui.text import get_font
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -7,14 +8,14 @@ class Button:
         self.text = text
         self.color = color
         self.hover_color = hover_color
-        self.current_color = color
         self.text_color = WHITE
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         self.hovered = False
     
     def draw(self, surface):
-        # Draw the button box
-        pygame.draw.rect(surface, self.current_color, self.rect)
+        # Draw the button box, highlighted while hovered
+        color = self.hover_color if self.hovered else self.color
+        pygame.draw.rect(surface, color, self.rect)
         pygame.draw.rect(surface, WHITE, self.rect, 2)  # White border
         
         # Render and draw text
@@ -24,13 +25,9 @@ class Button:
     
     def update(self, mouse_pos):
         # Check if the mouse is hovering over the button
-        if self.rect.collidepoint(mouse_pos):
-            self.current_color = self.hover_color
-            self.hovered = True
-        else:
-            self.current_color = self.color
-            self.hovered = False
+        self.hovered = bool(self.rect.collidepoint(mouse_pos))
     
     def is_clicked(self, event):
-        # Check if the mouse clicked on the button
-        return self.rect.collidepoint(event.pos)
+        # Check if the left mouse button was pressed over the button
+        return (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                and self.rect.collidepoint(event.pos))
@@ -1,10 +1,37 @@
 import pygame
 from src.core.constants import WHITE
 
+# Default fonts keyed by size, so each size is only constructed once
+_FONT_CACHE = {}
+
+def get_font(size):
+    """Get the default font at the given size, creating it on first use"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+# Rendered text surfaces keyed by (text, size, color), for text drawn every frame.
+# Kept in least to most recently used order and capped, since strings such as scores
+# and times produce new entries over a long session.
+_TEXT_CACHE = {}
+TEXT_CACHE_SIZE = 128
+
+def render_text(text, size, color=WHITE):
+    """Get the rendered surface for a string, rendering it only the first time it's drawn"""
+    key = (text, size, tuple(color))
+    text_surface = _TEXT_CACHE.pop(key, None)
+    if text_surface is None:
+        text_surface = get_font(size).render(text, True, color)
+        if len(_TEXT_CACHE) >= TEXT_CACHE_SIZE:
+            # Evict the least recently drawn text
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+    _TEXT_CACHE[key] = text_surface
+    return text_surface
+
 def draw_text(surface, text, size, x, y, color=WHITE):
     """Draw text on a surface with the specified parameters"""
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(text, size, color)
     text_rect = text_surface.get_rect(center=(x, y))
     surface.blit(text_surface, text_rect)
     return text_rect  # Return the rect in case it's needed
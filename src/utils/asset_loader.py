@@ -2,6 +2,7 @@ import os
 import pygame
 from pygame import mixer
 from src.core.constants import BASE_DIR, ASSETS_DIR
+from src.ui.text import get_font
 
 # Define paths for different asset types based on the existing structure
 def get_asset_path(asset_type, asset_name):
@@ -215,7 +216,7 @@ def load_image(asset_type, asset_name, fallback_color=(255, 0, 255)):
     
     # Simple colored rectangle with a letter indicating the asset type
     fallback.fill(fallback_color)
-    font = pygame.font.Font(None, 24)
+    font = get_font(24)
     
     # Get a short identifier for the asset_type
     identifier = asset_type.split('/')[-1][0].upper() if '/' in asset_type else asset_type[0].upper()
@@ -223,7 +224,7 @@ def load_image(asset_type, asset_name, fallback_color=(255, 0, 255)):
     text_rect = text.get_rect(center=(size[0]//2, size[1]//2))
     fallback.blit(text, text_rect)
     
-    return fallback
+    return fallback.convert_alpha()
 
 def load_sound(sound_name):
     """Load a sound with proper error handling"""